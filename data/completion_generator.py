@@ -0,0 +1,51 @@
+#!/usr/bin/python3 -B
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 igo95862
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from pathlib import Path
+from sys import stdout
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined
+
+from bubblejail.bubblejail_cli_metadata import BUBBLEJAIL_CMD
+
+
+def generate_completion(template_dir: Path, template_name: str) -> None:
+    env = Environment(
+        loader=FileSystemLoader(template_dir),
+        undefined=StrictUndefined,
+        keep_trailing_newline=True,
+    )
+
+    template = env.get_template(template_name)
+
+    stdout.write(
+        template.render(
+            subcommands=BUBBLEJAIL_CMD.keys(),
+            instance_subcommands=(
+                subcommand_name
+                for subcommand_name, subcommand_data in BUBBLEJAIL_CMD.items()
+                if "instance_name" in subcommand_data["add_argument"]
+            ),
+        )
+    )
+
+
+def main() -> None:
+    arg_parse = ArgumentParser()
+    arg_parse.add_argument(
+        "--template-dir",
+        required=True,
+        type=Path,
+    )
+    arg_parse.add_argument(
+        "template_name",
+    )
+
+    generate_completion(**vars(arg_parse.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
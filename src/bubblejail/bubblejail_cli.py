@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from argparse import ArgumentParser
-from asyncio import run as async_run
 from pathlib import Path
 from sys import argv, stderr, stdout
 from typing import TYPE_CHECKING
@@ -11,7 +10,6 @@ from typing import TYPE_CHECKING
 from .bubblejail_cli_metadata import BUBBLEJAIL_CMD
 from .bubblejail_directories import BubblejailDirectories
 from .bubblejail_utils import BubblejailSettings
-from .services import SERVICES_CLASSES
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator, Iterable, Iterator
@@ -62,6 +60,8 @@ def run_bjail(
     debug_log_dbus: bool,
     debug_helper_script: Optional[Path],
 ) -> None:
+    from asyncio import run as async_run
+
     try:
         instance = BubblejailDirectories.instance_get(instance_name)
 
@@ -138,6 +138,8 @@ def bjail_list(list_what: str) -> None:
     elif list_what == "profiles":
         str_iterator = BubblejailDirectories.iter_profile_names()
     elif list_what == "services":
+        from .services import SERVICES_CLASSES
+
         str_iterator = (x.name for x in SERVICES_CLASSES)
     elif list_what == "subcommands":
         str_iterator = iter_subcommands()
@@ -158,6 +160,8 @@ def bjail_create(
 
 
 def bjail_edit(instance_name: str) -> None:
+    from asyncio import run as async_run
+
     instance = BubblejailDirectories.instance_get(instance_name)
     async_run(instance.edit_config_in_editor())
 
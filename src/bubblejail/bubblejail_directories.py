@@ -2,21 +2,23 @@
 # SPDX-FileCopyrightText: 2019-2022 igo95862
 from __future__ import annotations
 
-from os import environ
+from functools import cache
+from os import environ, scandir
 from pathlib import Path
 from subprocess import run as subprocess_run
 from sys import stderr
 from tomllib import load as toml_load
-from typing import Any, Dict, Generator, Optional
+from typing import TYPE_CHECKING, Any, Dict, Generator, Optional
 
 from tomli_w import dump as toml_dump
-from xdg import IniFile
 from xdg.BaseDirectory import xdg_config_home, xdg_data_home
 
-from .bubblejail_instance import BubblejailInstance, BubblejailProfile
 from .bubblejail_utils import FILE_NAME_SERVICES, BubblejailSettings
 from .exceptions import BubblejailException, BubblejailInstanceNotFoundError
 
+if TYPE_CHECKING:
+    from .bubblejail_instance import BubblejailInstance, BubblejailProfile
+
 PathGeneratorType = Generator[Path, None, None]
 
 UsrSharePath = Path(BubblejailSettings.SHARE_PATH_STR)
@@ -28,57 +30,109 @@ PackageConfisgPath = UsrSharePath / "bubblejail"
 SystemConfigsPath = SysConfPath / "bubblejail"
 UserConfigDir = Path(xdg_config_home) / "bubblejail"
 
+EMPTY_DESKTOP_ENTRY_TEMPLATE = """[Desktop Entry]
+Exec=bubblejail run {instance_name}
+Name={instance_name} bubble
+Type=Application
+"""
 
-def convert_old_conf_to_new() -> None:
-    for instance_directory in BubblejailDirectories.iter_instances_path():
-        if (instance_directory / FILE_NAME_SERVICES).is_file():
-            continue
 
-        print(f"Converting {instance_directory.stem}", file=stderr)
+@cache
+def ensure_directory(directory: Path, parents: bool = False) -> Path:
+    # Only try to create each directory once per process.
+    # Usually it already exists and a stat is cheaper than
+    # a mkdir that fails with EEXIST.
+    if not directory.is_dir():
+        directory.mkdir(parents=parents, exist_ok=True)
 
-        old_conf_path = instance_directory / "config.toml"
-        with open(old_conf_path, mode="rb") as old_conf_file:
-            old_conf_dict = toml_load(old_conf_file)
+    return directory
 
-        new_conf: Dict[str, Any] = {}
 
-        try:
-            services_list = old_conf_dict.pop("services")
-        except KeyError:
-            services_list = []
+def convert_old_conf_to_new(instance_directory: Path) -> None:
+    if (instance_directory / FILE_NAME_SERVICES).is_file():
+        return
 
-        for service_name in services_list:
-            new_conf[service_name] = {}
+    print(f"Converting {instance_directory.stem}", file=stderr)
 
-        try:
-            old_service_dict = old_conf_dict.pop("service")
-        except KeyError:
-            old_service_dict = {}
+    old_conf_path = instance_directory / "config.toml"
+    with open(old_conf_path, mode="rb") as old_conf_file:
+        old_conf_dict = toml_load(old_conf_file)
+
+    services_list = old_conf_dict.pop("services", ())
+    old_service_dict = old_conf_dict.pop("service", {})
+
+    new_conf: Dict[str, Any] = {service_name: {} for service_name in services_list}
+    new_conf.update(old_service_dict)
+    new_conf["common"] = old_conf_dict
+
+    with open(instance_directory / FILE_NAME_SERVICES, mode="xb") as f:
+        toml_dump(new_conf, f)
 
-        for service_name, service_dict in old_service_dict.items():
-            new_conf[service_name] = service_dict
 
-        new_conf["common"] = old_conf_dict
+def rewrite_desktop_entry(dot_desktop_text: str, instance_name: str) -> str:
+    # Edit the desktop entry line by line instead of parsing
+    # and serializing the whole file
+    new_lines: list[str] = []
+    group_name = ""
+    desktop_entry_index: Optional[int] = None
+    is_name_set = False
 
-        with open(instance_directory / FILE_NAME_SERVICES, mode="xb") as f:
-            toml_dump(new_conf, f)
+    for line in dot_desktop_text.splitlines():
+        stripped_line = line.strip()
+
+        if stripped_line.startswith("["):
+            group_name = stripped_line.lstrip("[").rstrip("]")
+            if group_name == "Desktop Entry":
+                desktop_entry_index = len(new_lines)
+        elif "=" in stripped_line and not stripped_line.startswith("#"):
+            key, value = stripped_line.split("=", 1)
+            key = key.strip()
+            value = value.strip()
+
+            if key == "Exec" and value:
+                # Modify Exec
+                # Keep arguments as is, collapsing whitespace
+                # would break quoted arguments
+                line = f"Exec=bubblejail run -- {instance_name} {value}"
+            elif key == "Name" and group_name == "Desktop Entry":
+                # Modify name
+                line = f"Name={instance_name} bubble"
+                is_name_set = True
+
+        new_lines.append(line)
+
+    if not is_name_set:
+        if desktop_entry_index is None:
+            raise RuntimeError("Desktop entry is missing [Desktop Entry] group.")
+
+        new_lines.insert(desktop_entry_index + 1, f"Name={instance_name} bubble")
+
+    new_lines.append("")
+    return "\n".join(new_lines)
 
 
 class BubblejailDirectories:
 
     @classmethod
     def instance_get(cls, instance_name: str) -> BubblejailInstance:
-        convert_old_conf_to_new()
+        from .bubblejail_instance import BubblejailInstance
+
         for instances_dir in cls.iter_instances_directories():
-            possible_instance_path = instances_dir / instance_name
+            try:
+                instance = BubblejailInstance(instances_dir / instance_name)
+            except BubblejailInstanceNotFoundError:
+                continue
 
-            if possible_instance_path.is_dir():
-                return BubblejailInstance(possible_instance_path)
+            # Only the requested instance needs its config converted
+            convert_old_conf_to_new(instance.instance_directory)
+            return instance
 
         raise BubblejailInstanceNotFoundError(instance_name)
 
     @classmethod
     def profile_get(cls, profile_name: str) -> BubblejailProfile:
+        from .bubblejail_instance import BubblejailProfile
+
         profile_file_name = profile_name + ".toml"
         for profiles_directory in cls.iter_profile_directories():
             possible_profile_path = profiles_directory / profile_file_name
@@ -95,8 +149,11 @@ class BubblejailDirectories:
     def iter_profile_names(cls) -> Generator[str, None, None]:
         for profiles_directory in BubblejailDirectories.iter_profile_directories():
             try:
-                for profile_file in profiles_directory.iterdir():
-                    yield profile_file.stem
+                with scandir(profiles_directory) as profiles_dir_iter:
+                    for profile_entry in profiles_dir_iter:
+                        profile_file_name = profile_entry.name
+                        if profile_file_name.endswith(".toml"):
+                            yield profile_file_name[:-5]
             except FileNotFoundError:
                 continue
 
@@ -111,8 +168,7 @@ class BubblejailDirectories:
         try:
             conf_directories = environ["BUBBLEJAIL_CONFDIRS"]
         except KeyError:
-            UserConfigDir.mkdir(parents=True, exist_ok=True)
-            yield UserConfigDir
+            yield ensure_directory(UserConfigDir, parents=True)
             yield SystemConfigsPath
             yield PackageConfisgPath
             return
@@ -127,6 +183,7 @@ class BubblejailDirectories:
         create_dot_desktop: bool = False,
         print_import_tips: bool = False,
     ) -> BubblejailInstance:
+        from .bubblejail_instance import BubblejailInstance, BubblejailProfile
 
         instance_directory = next(cls.iter_instances_directories()) / new_name
 
@@ -156,6 +213,7 @@ class BubblejailDirectories:
                 cls.overwrite_desktop_entry_for_profile(
                     instance_name=new_name,
                     profile_object=profile,
+                    instance_object=instance,
                 )
             else:
                 cls.generate_empty_desktop_entry(new_name)
@@ -174,9 +232,7 @@ class BubblejailDirectories:
         try:
             data_directories = environ["BUBBLEJAIL_DATADIRS"]
         except KeyError:
-            home_path = Path(xdg_data_home + "/bubblejail")
-            home_path.mkdir(exist_ok=True, parents=True)
-            yield home_path
+            yield ensure_directory(Path(xdg_data_home + "/bubblejail"), parents=True)
             return
 
         yield from (Path(x) for x in data_directories.split(":"))
@@ -184,14 +240,17 @@ class BubblejailDirectories:
     @classmethod
     def iter_instances_directories(cls) -> PathGeneratorType:
         for data_dir in cls.iter_bubblejail_data_directories():
-            instances_dir_path = data_dir / "instances"
-            instances_dir_path.mkdir(exist_ok=True)
-            yield instances_dir_path
+            yield ensure_directory(data_dir / "instances")
 
     @classmethod
     def iter_instances_path(cls) -> PathGeneratorType:
         for instances_dir in cls.iter_instances_directories():
-            yield from instances_dir.iterdir()
+            # DirEntry.is_dir() uses file type returned by directory listing
+            # and does not need an extra stat
+            with scandir(instances_dir) as instances_dir_iter:
+                for instance_entry in instances_dir_iter:
+                    if instance_entry.is_dir():
+                        yield Path(instance_entry.path)
 
     @classmethod
     def desktop_entries_dir_get(cls) -> Path:
@@ -222,9 +281,16 @@ class BubblejailDirectories:
         profile_name: Optional[str] = None,
         desktop_entry_name: Optional[str] = None,
         new_name: Optional[str] = None,
+        instance_object: Optional[BubblejailInstance] = None,
     ) -> None:
 
-        instance = cls.instance_get(instance_name)
+        if instance_object is not None:
+            # Name of the passed instance takes precedence so that
+            # desktop entry and metadata refer to the same instance
+            instance = instance_object
+            instance_name = instance.name
+        else:
+            instance = cls.instance_get(instance_name)
 
         # Five ways to figure out desktop entry path
         if desktop_entry_name is not None:
@@ -249,29 +315,8 @@ class BubblejailDirectories:
         if dot_desktop_path is None:
             raise RuntimeError("Couldn't resolve desktop entry path.")
 
-        new_dot_desktop = IniFile.IniFile(filename=str(dot_desktop_path))
-
-        for group_name in new_dot_desktop.groups():
-            # Modify Exec
-            old_exec = new_dot_desktop.get(key="Exec", group=group_name)
-            if not old_exec:
-                continue
-
-            new_dot_desktop.set(
-                key="Exec",
-                value=(
-                    f"bubblejail run -- {instance_name} "
-                    f"{' '.join(old_exec.split())}"
-                ),
-                group=group_name,
-            )
-
-        # Modify name
-        new_dot_desktop.set(
-            key="Name",
-            group="Desktop Entry",
-            value=f"{instance_name} bubble",
-        )
+        with open(dot_desktop_path, encoding="utf-8", errors="replace") as f:
+            new_dot_desktop = rewrite_desktop_entry(f.read(), instance_name)
 
         # Three ways to resolve what file to write to
         new_dot_desktop_path = cls.desktop_entries_dir_get() / dot_desktop_path.name
@@ -290,7 +335,9 @@ class BubblejailDirectories:
                 cls.desktop_entries_dir_get() / f"bubble_{instance_name}.desktop"
             )
 
-        new_dot_desktop.write(filename=str(new_dot_desktop_path))
+        ensure_directory(new_dot_desktop_path.parent, parents=True)
+        with open(new_dot_desktop_path, mode="w", encoding="utf-8") as f:
+            f.write(new_dot_desktop)
 
         # Update desktop MIME database
         # Requires `update-desktop-database` binary
@@ -319,29 +366,10 @@ class BubblejailDirectories:
         cls,
         instance_name: str,
     ) -> None:
-
-        new_dot_desktop = IniFile.IniFile()
-        new_dot_desktop.addGroup("Desktop Entry")
-        new_dot_desktop.set(
-            key="Exec", value=f"bubblejail run {instance_name}", group="Desktop Entry"
-        )
-
-        # Modify name
-        new_dot_desktop.set(
-            key="Name",
-            group="Desktop Entry",
-            value=f"{instance_name} bubble",
-        )
-
-        # Add type
-        new_dot_desktop.set(
-            key="Type",
-            group="Desktop Entry",
-            value="Application",
-        )
-
-        new_dot_desktop_path_str = str(
+        new_dot_desktop_path = (
             cls.desktop_entries_dir_get() / f"bubble_{instance_name}.desktop"
         )
 
-        new_dot_desktop.write(filename=new_dot_desktop_path_str)
+        ensure_directory(new_dot_desktop_path.parent, parents=True)
+        with open(new_dot_desktop_path, mode="w", encoding="utf-8") as f:
+            f.write(EMPTY_DESKTOP_ENTRY_TEMPLATE.format(instance_name=instance_name))
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 from dataclasses import MISSING
 from functools import partial
+from itertools import count, islice
 from shlex import split as shlex_split
 from sys import argv
-from typing import Any, List, Optional, Tuple, Type, cast
+from typing import Any, Dict, List, Optional, Tuple, Type, cast
 
-from PyQt6.QtCore import QModelIndex
+from PyQt6.QtCore import QModelIndex, QTimer
 from PyQt6.QtWidgets import (
     QApplication,
+    QButtonGroup,
     QCheckBox,
     QComboBox,
     QFormLayout,
@@ -90,7 +92,13 @@ class OptionWidgetStrList(OptionWidgetBase):
         self.form_widget.setLayout(self.form_layout)
         self.vertical_layout.addWidget(self.form_widget)
 
-        self.line_edit_widgets: List[QLineEdit] = []
+        # Rows keyed by id so that removing one does not scan the list
+        self.line_edit_widgets: Dict[int, QLineEdit] = {}
+        self.line_edit_ids = count()
+        # Single connection for all remove buttons, the button id
+        # is the id of the row it removes
+        self.remove_buttons = QButtonGroup(self.widget)
+        self.remove_buttons.idClicked.connect(self.remove_line_edit)
 
         self.add_button = QPushButton("Add")
         self.add_button.setToolTip(self.description)
@@ -108,8 +116,8 @@ class OptionWidgetStrList(OptionWidgetBase):
         for string in str_list:
             self.add_line_edit(existing_string=string)
 
-    def remove_line_edit(self, line_edit_widget: QLineEdit) -> None:
-        self.line_edit_widgets.remove(line_edit_widget)
+    def remove_line_edit(self, line_edit_id: int) -> None:
+        line_edit_widget = self.line_edit_widgets.pop(line_edit_id)
         self.form_layout.removeRow(line_edit_widget)
         # HACK: add_button stops functioning if all rows get deleted
         # add empty row to prevent that.
@@ -131,16 +139,17 @@ class OptionWidgetStrList(OptionWidgetBase):
 
         new_line_edit.setToolTip(self.description)
 
-        self.line_edit_widgets.append(new_line_edit)
+        new_line_edit_id = next(self.line_edit_ids)
+        self.line_edit_widgets[new_line_edit_id] = new_line_edit
 
         new_push_button = QPushButton("❌")
 
         self.form_layout.addRow(new_push_button, new_line_edit)
 
-        new_push_button.clicked.connect(partial(self.remove_line_edit, new_line_edit))
+        self.remove_buttons.addButton(new_push_button, new_line_edit_id)
 
     def get_string_list(self) -> list[str]:
-        text_list = [x.text() for x in self.line_edit_widgets]
+        text_list = [x.text() for x in self.line_edit_widgets.values()]
         return [maybe_empty for maybe_empty in text_list if maybe_empty]
 
 
@@ -292,6 +301,15 @@ class OptionWidgetCombobox(OptionWidgetBase):
         return self.combobox.currentText()
 
 
+SETTING_TYPE_TO_WIDGET: dict[str, Type[OptionWidgetBase]] = {
+    "bool": OptionWidgetBool,
+    "str": OptionWidgetStr,
+    "str | list[str]": OptionWidgetSpaceSeparatedStr,
+    "list[str]": OptionWidgetStrList,
+    "int": OptionWidgetInt,
+}
+
+
 class ServiceWidget:
     def __init__(
         self,
@@ -316,7 +334,21 @@ class ServiceWidget:
         if service_settings is None:
             service_settings = {}
 
-        for setting_field in service.iter_settings_fields():
+        self.service_settings = service_settings
+        # Most services are disabled and their options are never looked at.
+        # Create option widgets the first time the service gets checked.
+        # setCheckable(True) also checks the box, uncheck it first so that
+        # enabling the service emits toggled.
+        self.group_widget.setChecked(False)
+        self.group_widget.toggled.connect(self.build_option_widgets)
+
+    def build_option_widgets(self, is_checked: bool) -> None:
+        if not is_checked:
+            return
+
+        self.group_widget.toggled.disconnect(self.build_option_widgets)
+
+        for setting_field in self.service.iter_settings_fields():
             setting_metadata = cast(
                 SettingFieldMetadata,
                 setting_field.metadata,
@@ -324,24 +356,14 @@ class ServiceWidget:
             if setting_metadata["is_deprecated"]:
                 continue
 
-            match str(setting_field.type):
-                case "bool":
-                    widget_class: Type[OptionWidgetBase] = OptionWidgetBool
-                case "str":
-                    widget_class = OptionWidgetStr
-                case "str | list[str]":
-                    widget_class = OptionWidgetSpaceSeparatedStr
-                case "list[str]":
-                    widget_class = OptionWidgetStrList
-                case "int":
-                    widget_class = OptionWidgetInt
-                case unknown_type:
-                    raise TypeError(
-                        f"Unknown field type {unknown_type} "
-                        f"of setting {setting_field.name}"
-                    )
-
-            setting_value = service_settings.get(setting_field.name, None)
+            widget_class = SETTING_TYPE_TO_WIDGET.get(str(setting_field.type))
+            if widget_class is None:
+                raise TypeError(
+                    f"Unknown field type {setting_field.type} "
+                    f"of setting {setting_field.name}"
+                )
+
+            setting_value = self.service_settings.get(setting_field.name, None)
 
             if setting_value is None:
                 default_value = setting_field.default
@@ -403,6 +425,10 @@ class ServiceWidget:
 # region Central Widgets
 
 
+# Number of service widgets created between event loop iterations
+SERVICE_WIDGETS_PER_BATCH = 3
+
+
 class CentralWidgets:
     def __init__(self, parent: BubblejailConfigApp):
         self.parent = parent
@@ -418,16 +444,21 @@ class InstanceEditWidget(CentralWidgets):
 
         header = QHBoxLayout()
         # Back button
-        back_button = QPushButton("Back")
-        back_button.clicked.connect(self.parent.switch_to_selector)
-        header.addWidget(back_button)
+        self.back_button = QPushButton("Back")
+        self.back_button.clicked.connect(self.parent.switch_to_selector)
+        header.addWidget(self.back_button)
         # Label
-        header_label = QLabel(f"Editing {instance_name}")
-        header.addWidget(header_label)
+        self.header_label = QLabel(f"Loading {instance_name}")
+        header.addWidget(self.header_label)
         # Save button
-        save_button = QPushButton("Save")
-        save_button.clicked.connect(partial(InstanceEditWidget.set_instance_data, self))
-        header.addWidget(save_button)
+        self.save_button = QPushButton("Save")
+        self.save_button.clicked.connect(
+            partial(InstanceEditWidget.set_instance_data, self)
+        )
+        header.addWidget(self.save_button)
+        # Buttons are enabled once all service widgets are created
+        self.back_button.setEnabled(False)
+        self.save_button.setEnabled(False)
 
         self.main_layout.addLayout(header)
 
@@ -443,15 +474,23 @@ class InstanceEditWidget(CentralWidgets):
         # Instance
         self.bubblejail_instance = BubblejailDirectories.instance_get(instance_name)
         self.instance_config = self.bubblejail_instance._read_config()
-        services_settings_dicts: ServicesConfDictType = (
+        self.services_settings_dicts: ServicesConfDictType = (
             self.instance_config.get_service_conf_dict()
         )
 
         self.service_widgets: List[ServiceWidget] = []
-        for service in SERVICES_CLASSES:
+        # Create service widgets in small batches so that the window
+        # gets painted and stays responsive while they are built
+        self.services_to_add = iter(SERVICES_CLASSES)
+        QTimer.singleShot(0, self.add_service_widgets_batch)
+
+    def add_service_widgets_batch(self) -> None:
+        services_batch = tuple(islice(self.services_to_add, SERVICE_WIDGETS_PER_BATCH))
+
+        for service in services_batch:
             try:
                 service_settings_dict: None | ServiceSettingsDict = (
-                    services_settings_dicts[service.name]
+                    self.services_settings_dicts[service.name]
                 )
             except KeyError:
                 service_settings_dict = None
@@ -472,7 +511,14 @@ class InstanceEditWidget(CentralWidgets):
                 service_settings_dict is not None
             )
 
+        if len(services_batch) == SERVICE_WIDGETS_PER_BATCH:
+            QTimer.singleShot(0, self.add_service_widgets_batch)
+            return
+
         self.refresh_conflicts(True)
+        self.header_label.setText(f"Editing {self.bubblejail_instance.name}")
+        self.back_button.setEnabled(True)
+        self.save_button.setEnabled(True)
 
     def set_instance_data(self) -> None:
         new_config = {
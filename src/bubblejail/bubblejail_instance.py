@@ -23,7 +23,7 @@ from xdg.BaseDirectory import get_runtime_dir
 from .bubblejail_helper import RequestRun
 from .bubblejail_runner import BubblejailRunner
 from .bubblejail_utils import FILE_NAME_METADATA, FILE_NAME_SERVICES
-from .exceptions import BubblejailException, BubblewrapRunError
+from .exceptions import BubblejailInstanceNotFoundError, BubblewrapRunError
 from .services import ServiceContainer as BubblejailInstanceConfig
 from .services import ServicesConfDictType
 
@@ -36,8 +36,8 @@ class BubblejailInstance:
         self.instance_directory = instance_home
         # If instance directory does not exists we can't do much
         # Probably someone used 'run' command before 'create'
-        if not self.instance_directory.exists():
-            raise BubblejailException("Instance directory does not exist")
+        if not self.instance_directory.is_dir():
+            raise BubblejailInstanceNotFoundError("Instance directory does not exist")
 
     # region Paths
     @cached_property
@@ -77,7 +77,8 @@ class BubblejailInstance:
 
     # region Metadata
 
-    def _get_metadata_dict(self) -> dict[str, Any]:
+    @cached_property
+    def _metadata_dict(self) -> dict[str, Any]:
         try:
             with open(self.path_metadata_file) as metadata_file:
                 return toml_loads(metadata_file.read())
@@ -85,7 +86,7 @@ class BubblejailInstance:
             return {}
 
     def _save_metadata_key(self, key: str, value: Any) -> None:
-        toml_dict = self._get_metadata_dict()
+        toml_dict = self._metadata_dict
         toml_dict[key] = value
 
         with open(self.path_metadata_file, mode="wb") as metadata_file:
@@ -93,7 +94,7 @@ class BubblejailInstance:
 
     def _get_metadata_value(self, key: str) -> str | None:
         try:
-            value = self._get_metadata_dict()[key]
+            value = self._metadata_dict[key]
             if isinstance(value, str):
                 return value
             else:
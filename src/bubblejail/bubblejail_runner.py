@@ -6,14 +6,14 @@ from asyncio import Future, create_subprocess_exec, get_running_loop, wait_for
 from contextlib import asynccontextmanager, contextmanager
 from contextlib import suppress as exc_suppress
 from io import StringIO
+from itertools import chain
 from json import loads as json_loads
-from os import O_CLOEXEC, O_NONBLOCK
+from os import MFD_CLOEXEC, O_CLOEXEC, O_NONBLOCK
 from os import close as close_fd
-from os import environ, kill, pipe2
+from os import environ, kill, memfd_create, pipe2, pwrite
 from signal import SIGTERM
 from socket import AF_UNIX, socket
 from sys import stderr
-from tempfile import TemporaryFile
 from traceback import print_exc
 from typing import TYPE_CHECKING
 
@@ -35,17 +35,45 @@ if TYPE_CHECKING:
     from asyncio.subprocess import Process
     from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
     from contextlib import AsyncExitStack
-    from typing import IO
 
     from .bubblejail_instance import BubblejailInstance
     from .services import ServiceContainer as BubblejailInstanceConfig
 
 
-def copy_data_to_temp_file(data: bytes) -> IO[bytes]:
-    temp_file = TemporaryFile()
-    temp_file.write(data)
-    temp_file.seek(0)
-    return temp_file
+# Options passed to every sandbox regardless of instance config
+BWRAP_STATIC_OPTIONS: tuple[str, ...] = (
+    # Unshare all
+    "--unshare-all",
+    # Die with parent
+    "--die-with-parent",
+    # We have our own reaper
+    "--as-pid-1",
+    # Proc
+    "--proc",
+    "/proc",
+    # Devtmpfs
+    "--dev",
+    "/dev",
+    # Unset all variables
+    "--clearenv",
+)
+
+
+def copy_data_to_temp_file(data: bytes) -> int:
+    temp_fd = memfd_create("bubblejail", MFD_CLOEXEC)
+    try:
+        # pwrite does not move file offset so bwrap reads from the start.
+        # It can write less than asked, a truncated arguments buffer
+        # would silently drop sandbox options.
+        data_view = memoryview(data)
+        written = 0
+        while written < len(data_view):
+            written += pwrite(temp_fd, data_view[written:], written)
+    except BaseException:
+        close_fd(temp_fd)
+        raise
+
+    return temp_fd
 
 
 class BubblejailRunner:
@@ -59,8 +87,8 @@ class BubblejailRunner:
     ) -> None:
         self.home_bind_path = parent.path_home_directory
         self.runtime_dir = parent.runtime_dir
-        # Prevent our temporary file from being garbage collected
-        self.bwrap_temp_files: list[IO[bytes]] = []
+        # Temporary files passed to bwrap, closed once sandbox is ready
+        self.bwrap_temp_fds: list[int] = []
         self.file_descriptors_to_pass: list[int] = []
         # Helper
         self.helper_executable: list[str] = [BubblejailSettings.HELPER_PATH_STR]
@@ -121,25 +149,12 @@ class BubblejailRunner:
         dbus_session_opts: set[str] = set()
         dbus_system_opts: set[str] = set()
         seccomp_state: SeccompState | None = None
-        # Unshare all
-        self.bwrap_options_args.append("--unshare-all")
-        # Die with parent
-        self.bwrap_options_args.append("--die-with-parent")
-        # We have our own reaper
-        self.bwrap_options_args.append("--as-pid-1")
+        self.bwrap_options_args.extend(BWRAP_STATIC_OPTIONS)
 
         if not self.is_shell_debug:
             # Set new session
             self.bwrap_options_args.append("--new-session")
 
-        # Proc
-        self.bwrap_options_args.extend(("--proc", "/proc"))
-        # Devtmpfs
-        self.bwrap_options_args.extend(("--dev", "/dev"))
-
-        # Unset all variables
-        self.bwrap_options_args.append("--clearenv")
-
         # Pass terminal variables if debug shell activated
         if self.is_shell_debug:
             if term_env := environ.get("TERM"):
@@ -167,9 +182,8 @@ class BubblejailRunner:
                     self.bwrap_options_args.extend(config.to_args())
                 elif isinstance(config, FileTransfer):
                     # Copy files
-                    temp_f = copy_data_to_temp_file(config.content)
-                    self.bwrap_temp_files.append(temp_f)
-                    temp_file_descriptor = temp_f.fileno()
+                    temp_file_descriptor = copy_data_to_temp_file(config.content)
+                    self.bwrap_temp_fds.append(temp_file_descriptor)
                     self.file_descriptors_to_pass.append(temp_file_descriptor)
                     self.bwrap_options_args.extend(
                         (
@@ -194,10 +208,9 @@ class BubblejailRunner:
                     raise TypeError("Unknown bwrap config.")
 
         if seccomp_state is not None:
-            seccomp_temp_file = seccomp_state.export_to_temp_file()
-            seccomp_fd = seccomp_temp_file.fileno()
+            seccomp_fd = seccomp_state.export_to_temp_file()
             self.file_descriptors_to_pass.append(seccomp_fd)
-            self.bwrap_temp_files.append(seccomp_temp_file)
+            self.bwrap_temp_fds.append(seccomp_fd)
             self.bwrap_options_args.extend(("--seccomp", str(seccomp_fd)))
 
         self.post_init_hooks.extend(self.instance_config.iter_post_init_hooks())
@@ -306,10 +319,9 @@ class BubblejailRunner:
     def get_args_file_descriptor(self) -> int:
         options_null = "\0".join(self.bwrap_options_args)
 
-        args_tempfile = copy_data_to_temp_file(options_null.encode())
-        args_tempfile_fileno = args_tempfile.fileno()
+        args_tempfile_fileno = copy_data_to_temp_file(options_null.encode())
         self.file_descriptors_to_pass.append(args_tempfile_fileno)
-        self.bwrap_temp_files.append(args_tempfile)
+        self.bwrap_temp_fds.append(args_tempfile_fileno)
 
         return args_tempfile_fileno
 
@@ -330,9 +342,8 @@ class BubblejailRunner:
             ):
                 f.write("bubblejail-ready")
 
-        with exc_suppress(IndexError):
-            while t := self.bwrap_temp_files.pop():
-                t.close()
+        while self.bwrap_temp_fds:
+            close_fd(self.bwrap_temp_fds.pop())
 
     async def _run_post_shutdown_hooks(self) -> None:
         for hook in self.post_shutdown_hooks:
@@ -434,18 +445,12 @@ class BubblejailRunner:
         self,
         run_args: Iterable[str] | None = None,
     ) -> AsyncIterator[Process]:
-        bwrap_args = ["/usr/bin/bwrap"]
-        # Pass option args file descriptor
-        bwrap_args.append("--args")
-        bwrap_args.append(str(self.get_args_file_descriptor()))
-        bwrap_args.append("--")
-
-        bwrap_args.extend(self.helper_arguments())
-
-        if run_args:
-            bwrap_args.extend(run_args)
-        else:
-            bwrap_args.extend(self.executable_args)
+        bwrap_args = chain(
+            # Pass option args file descriptor
+            ("/usr/bin/bwrap", "--args", str(self.get_args_file_descriptor()), "--"),
+            self.helper_arguments(),
+            run_args if run_args else self.executable_args,
+        )
 
         try:
             self.bubblewrap_process = await create_subprocess_exec(
@@ -492,5 +497,5 @@ class BubblejailRunner:
         except OSError:
             ...
 
-        for t in self.bwrap_temp_files:
-            t.close()
+        for temp_fd in self.bwrap_temp_fds:
+            close_fd(temp_fd)
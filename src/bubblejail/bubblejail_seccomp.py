@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from ctypes import CDLL, c_char_p, c_int, c_uint, c_uint32, c_void_p
 from ctypes.util import find_library
+from os import MFD_CLOEXEC, SEEK_SET
+from os import close as close_fd
+from os import lseek, memfd_create
 from platform import machine
-from tempfile import TemporaryFile
 from typing import TYPE_CHECKING
 
 from .bwrap_config import SeccompDirective, SeccompSyscallErrno
@@ -13,7 +15,7 @@ from .exceptions import BubblejailLibseccompError, LibseccompSyscallResolutionEr
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from typing import IO, Any
+    from typing import Any
 
 
 SCMP_ACT_ALLOW = c_uint(0x7FFF0000)
@@ -170,14 +172,19 @@ class SeccompState:
     def load(self) -> None:
         self.libseccomp.load(self._seccomp_ruleset_ptr)
 
-    def export_to_temp_file(self) -> IO[bytes]:
-        t = TemporaryFile()
-        self.libseccomp.export_bpf(
-            self._seccomp_ruleset_ptr,
-            c_int(t.fileno()),
-        )
-        t.seek(0)
-        return t
+    def export_to_temp_file(self) -> int:
+        temp_fd = memfd_create("bubblejail-seccomp", MFD_CLOEXEC)
+        try:
+            self.libseccomp.export_bpf(
+                self._seccomp_ruleset_ptr,
+                c_int(temp_fd),
+            )
+            lseek(temp_fd, 0, SEEK_SET)
+        except BaseException:
+            close_fd(temp_fd)
+            raise
+
+        return temp_fd
 
     def print(self) -> None:
         self.libseccomp.export_pfc(
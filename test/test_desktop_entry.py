@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2024 igo95862
+from __future__ import annotations
+
+from unittest import TestCase
+from unittest import main as unittest_main
+
+from bubblejail.bubblejail_directories import rewrite_desktop_entry
+
+TEST_DESKTOP_ENTRY = """[Desktop Entry]
+# Comment
+Name=Test
+Name[de]=Prüfung
+Exec=test-app %u
+Type=Application
+Actions=new-window;
+
+[Desktop Action new-window]
+Name=New Window
+Exec=test-app --new-window %u
+
+[Desktop Action quoted]
+Exec=test-app "quoted  argument"
+"""
+
+
+class TestDesktopEntry(TestCase):
+    def test_rewrite(self) -> None:
+        new_lines = rewrite_desktop_entry(TEST_DESKTOP_ENTRY, "test").splitlines()
+
+        self.assertIn("Name=test bubble", new_lines)
+        self.assertIn("Name=New Window", new_lines)
+        self.assertIn("Name[de]=Prüfung", new_lines)
+        self.assertIn("# Comment", new_lines)
+        self.assertIn("Exec=bubblejail run -- test test-app %u", new_lines)
+        self.assertIn(
+            "Exec=bubblejail run -- test test-app --new-window %u",
+            new_lines,
+        )
+        self.assertIn(
+            'Exec=bubblejail run -- test test-app "quoted  argument"',
+            new_lines,
+        )
+
+    def test_missing_name(self) -> None:
+        new_lines = rewrite_desktop_entry(
+            "[Desktop Entry]\nExec=test-app\n", "test"
+        ).splitlines()
+
+        self.assertEqual(new_lines[1], "Name=test bubble")
+
+        with self.assertRaises(RuntimeError):
+            rewrite_desktop_entry("Exec=test-app\n", "test")
+
+
+if __name__ == "__main__":
+    unittest_main()
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026 igo95862
+from __future__ import annotations
+
+from os import environ
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from tomllib import loads as toml_loads
+from unittest import TestCase
+from unittest import main as unittest_main
+from unittest import skipIf
+from unittest.mock import MagicMock
+
+from bubblejail import bubblejail_directories
+from bubblejail.bubblejail_directories import BubblejailDirectories
+from bubblejail.services import SERVICES_CLASSES
+
+try:
+    from PyQt6.QtCore import QCoreApplication
+    from PyQt6.QtWidgets import QApplication
+
+    from bubblejail.bubblejail_gui_qt import InstanceEditWidget
+except ImportError:
+    HAS_QT = False
+else:
+    HAS_QT = True
+
+test_services_config = """
+[common]
+executable_name = "firefox"
+
+[home_share]
+home_paths = ["Downloads", "Music"]
+"""
+
+
+@skipIf(not HAS_QT, "PyQt6 is not installed")
+class TestInstanceEdit(TestCase):
+    q_app: QCoreApplication
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        cls.q_app = QApplication.instance() or QApplication([])
+
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory(
+            prefix="bubblejail_test_dir",
+        )
+        self.addCleanup(self.temp_dir.cleanup)
+        self.data_dir = Path(self.temp_dir.name)
+
+        setattr(
+            bubblejail_directories,
+            "xdg_data_home",
+            str(self.data_dir),
+        )
+
+        self.test_instance_name = "test_instance"
+        instance = BubblejailDirectories.create_new_instance(self.test_instance_name)
+        instance.path_config_file.write_text(test_services_config)
+        self.test_instance_config_path = instance.path_config_file
+
+    def test_save_keeps_settings(self) -> None:
+        edit_widget = InstanceEditWidget(MagicMock(), self.test_instance_name)
+
+        # Service widgets are created in batches by the event loop.
+        # Each iteration runs at least one batch.
+        for _ in range(len(SERVICES_CLASSES)):
+            if edit_widget.save_button.isEnabled():
+                break
+
+            self.q_app.processEvents()
+
+        self.assertTrue(
+            edit_widget.save_button.isEnabled(),
+            "Service widgets were not created",
+        )
+
+        edit_widget.set_instance_data()
+
+        saved_config = toml_loads(self.test_instance_config_path.read_text())
+        self.assertEqual(saved_config["common"]["executable_name"], "firefox")
+        self.assertEqual(
+            saved_config["home_share"]["home_paths"],
+            ["Downloads", "Music"],
+        )
+
+
+if __name__ == "__main__":
+    unittest_main()
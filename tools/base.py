@@ -11,6 +11,7 @@ PYTHON_SOURCES: list[Path] = [
     PROJECT_ROOT_PATH / "tools",
     PROJECT_ROOT_PATH / "test",
     PROJECT_ROOT_PATH / "docs/man_generator.py",
+    PROJECT_ROOT_PATH / "data/completion_generator.py",
 ]
 
 __all__ = ("PROJECT_ROOT_PATH", "BUILD_DIR", "PYTHON_SOURCES")